@@ -4,38 +4,51 @@ from __future__ import annotations
 
 import argparse
 import json
+import sys
 from dataclasses import is_dataclass
 from pathlib import Path
 from typing import Any
 
-from .commands import fortify, ledger, pinpoint, pulse, sentinel, sieve, survey
-from .state import _default as serialize_default
 from .version import __version__
 
+try:  # Optional speedup: orjson serializes dataclasses natively in C.
+    import orjson
+except ImportError:  # pragma: no cover - depends on environment
+    orjson = None  # type: ignore[assignment]
+
 
 def _json_dump(obj: Any) -> str:
-    payload = serialize_default(obj) if is_dataclass(obj) else obj
-    return json.dumps(payload, indent=2, sort_keys=True)
+    from .state import _default as serialize_default
+
+    # Pre-convert to plain dicts: OPT_SORT_KEYS only orders dict keys, so
+    # feeding orjson the dataclass directly would emit field order and the
+    # output would depend on which backend is installed.
+    if is_dataclass(obj):
+        obj = serialize_default(obj)
+    if orjson is not None:
+        return orjson.dumps(
+            obj,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS,
+            default=serialize_default,
+        ).decode()
+    return json.dumps(obj, indent=2, sort_keys=True)
 
 
 def _print(obj: Any) -> None:
     print(_json_dump(obj))
 
 
-def build_parser() -> argparse.ArgumentParser:
-    parser = argparse.ArgumentParser(description="MCP-Check security toolkit")
-    parser.add_argument("--state-dir", default=None, help="Directory for persisted command output")
-    parser.add_argument("--root", default=".", help="Directory that contains MCP manifests")
-    parser.add_argument("--version", action="version", version=f"mcp-check {__version__}")
-
-    subparsers = parser.add_subparsers(dest="command", required=True)
-
+def _add_survey_parser(subparsers) -> None:
     subparsers.add_parser("survey", help="Discover MCP servers and capture a baseline")
 
+
+def _add_pulse_parser(subparsers) -> None:
     pulse_parser = subparsers.add_parser("pulse", help="Perform handshake diagnostics")
     pulse_parser.add_argument("server", help="Server name to probe")
     pulse_parser.add_argument("--scenario", default="handshake", help="Scenario key to use")
 
+
+def _add_pinpoint_parser(subparsers) -> None:
     pinpoint_parser = subparsers.add_parser("pinpoint", help="Run targeted exploit simulations")
     pinpoint_parser.add_argument("server", help="Server name to target")
     pinpoint_parser.add_argument(
@@ -45,18 +58,81 @@ def build_parser() -> argparse.ArgumentParser:
         help="Scenario to execute (may be specified multiple times)",
     )
 
+
+def _add_sieve_parser(subparsers) -> None:
     sieve_parser = subparsers.add_parser("sieve", help="Run static analysis on tools")
     sieve_parser.add_argument("server", help="Server name to analyze")
 
+
+def _add_sentinel_parser(subparsers) -> None:
     sentinel_parser = subparsers.add_parser("sentinel", help="Evaluate runtime telemetry")
     sentinel_parser.add_argument("server", help="Server name to guard")
     sentinel_parser.add_argument("--stream-threshold", type=int, default=500_000, help="Threshold for stream chunks")
     sentinel_parser.add_argument("--rate-limit", type=int, default=200, help="Allowed requests per window")
 
+
+def _add_ledger_parser(subparsers) -> None:
     subparsers.add_parser("ledger", help="Aggregate stored findings")
 
+
+def _add_fortify_parser(subparsers) -> None:
     subparsers.add_parser("fortify", help="Produce remediation plan")
 
+
+_SUBPARSER_BUILDERS = {
+    "survey": _add_survey_parser,
+    "pulse": _add_pulse_parser,
+    "pinpoint": _add_pinpoint_parser,
+    "sieve": _add_sieve_parser,
+    "sentinel": _add_sentinel_parser,
+    "ledger": _add_ledger_parser,
+    "fortify": _add_fortify_parser,
+}
+
+# Global options that consume the following token, so a value such as
+# "--root pulse" is not mistaken for a subcommand.
+_VALUE_OPTIONS = {"--state-dir", "--root"}
+
+
+def _sniff_subcommand(argv: list[str] | None) -> str | None:
+    """Return the subcommand named in *argv*, or ``None`` when unclear."""
+
+    if argv is None:
+        return None
+    skip_next = False
+    for token in argv:
+        if skip_next:
+            skip_next = False
+            continue
+        if token in _VALUE_OPTIONS:
+            skip_next = True
+            continue
+        if token.startswith("-"):
+            # Anything else option-like (-h, --version, an abbreviated or
+            # --opt=value spelling) may consume the next token, so fall
+            # back to building every subparser rather than guess.
+            return None
+        # The first positional is the command slot; if it is not a known
+        # command, build every subparser so the error lists all choices.
+        return token if token in _SUBPARSER_BUILDERS else None
+    return None
+
+
+def build_parser(argv: list[str] | None = None) -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="MCP-Check security toolkit")
+    parser.add_argument("--state-dir", default=None, help="Directory for persisted command output")
+    parser.add_argument("--root", default=".", help="Directory that contains MCP manifests")
+    parser.add_argument("--version", action="version", version=f"mcp-check {__version__}")
+
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    sniffed = _sniff_subcommand(argv)
+    if sniffed is not None:
+        _SUBPARSER_BUILDERS[sniffed](subparsers)
+    else:
+        for builder in _SUBPARSER_BUILDERS.values():
+            builder(subparsers)
+
     return parser
 
 
@@ -66,14 +142,24 @@ def dispatch(args: argparse.Namespace) -> Any:
     command = args.command
 
     if command == "survey":
+        from .commands import survey
+
         return survey.execute(root, state_dir)
     if command == "pulse":
+        from .commands import pulse
+
         return pulse.execute(root, args.server, scenario=args.scenario, state_dir=state_dir)
     if command == "pinpoint":
+        from .commands import pinpoint
+
         return pinpoint.execute(root, args.server, scenarios=args.scenarios, state_dir=state_dir)
     if command == "sieve":
+        from .commands import sieve
+
         return sieve.execute(root, args.server, state_dir=state_dir)
     if command == "sentinel":
+        from .commands import sentinel
+
         return sentinel.execute(
             root,
             args.server,
@@ -82,14 +168,20 @@ def dispatch(args: argparse.Namespace) -> Any:
             state_dir=state_dir,
         )
     if command == "ledger":
+        from .commands import ledger
+
         return ledger.execute(state_dir)
     if command == "fortify":
+        from .commands import fortify
+
         return fortify.execute(root, state_dir=state_dir)
     raise ValueError(f"Unknown command: {command}")
 
 
 def main(argv: list[str] | None = None) -> None:
-    parser = build_parser()
+    if argv is None:
+        argv = sys.argv[1:]
+    parser = build_parser(argv)
     args = parser.parse_args(argv)
     result = dispatch(args)
     _print(result)
@@ -1,6 +1,10 @@
-"""Command implementations for MCP-Check."""
+"""Command implementations for MCP-Check.
 
-from . import fortify, ledger, pinpoint, pulse, sentinel, sieve, survey
+Submodules are imported lazily (PEP 562) so that loading one command does
+not pay the import cost of its siblings.
+"""
+
+from importlib import import_module
 
 __all__ = [
     "fortify",
@@ -11,3 +15,11 @@ __all__ = [
     "sieve",
     "survey",
 ]
+
+
+def __getattr__(name: str):
+    if name in __all__:
+        module = import_module(f".{name}", __name__)
+        globals()[name] = module
+        return module
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
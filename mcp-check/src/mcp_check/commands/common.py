@@ -4,8 +4,9 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from datetime import datetime, timezone
+from hashlib import sha256
 from pathlib import Path
-from typing import Iterable, List, Optional
+from typing import Dict, Iterable, List, Optional, Tuple
 
 from ..loader import calculate_fingerprint, discover_manifests, load_manifest
 from ..models import ServerConfig, SurveyResult
@@ -18,6 +19,7 @@ class CommandContext:
 
     manifests: List[Path]
     servers: List[ServerConfig]
+    by_name: Dict[str, ServerConfig]
     state: StateStore
 
 
@@ -33,31 +35,62 @@ def resolve_manifests(root: Path | str) -> List[Path]:
 
 
 def load_servers(paths: Iterable[Path]) -> List[ServerConfig]:
-    servers: List[ServerConfig] = []
+    merged: dict[str, ServerConfig] = {}
     for path in paths:
-        servers.extend(load_manifest(path))
-    return servers
+        merged.update((server.name, server) for server in load_manifest(path))
+    return list(merged.values())
 
 
 def build_context(root: Path | str, state_dir: Optional[str | Path] = None) -> CommandContext:
     manifests = resolve_manifests(root)
     servers = load_servers(manifests)
+    by_name = {server.name: server for server in servers}
     state = build_state(state_dir)
-    return CommandContext(manifests=manifests, servers=servers, state=state)
+    return CommandContext(manifests=manifests, servers=servers, by_name=by_name, state=state)
 
 
-def make_survey_result(context: CommandContext) -> SurveyResult:
-    fingerprint = calculate_fingerprint(context.manifests)
+def build_survey_context(
+    root: Path | str, state_dir: Optional[str | Path] = None
+) -> Tuple[CommandContext, str]:
+    """Build a context and its manifest fingerprint in one read per file.
+
+    Equivalent to ``build_context`` followed by ``calculate_fingerprint``,
+    but each manifest's bytes are read once and fed to both the parser and
+    the digest.
+    """
+
+    manifests = resolve_manifests(root)
+    digest = sha256()
+    merged: dict[str, ServerConfig] = {}
+    for path in sorted(manifests):
+        raw = path.read_bytes()
+        digest.update(str(path).encode("utf-8") + b"\0")
+        digest.update(raw)
+        merged.update((server.name, server) for server in load_manifest(path, raw))
+    servers = list(merged.values())
+    by_name = {server.name: server for server in servers}
+    state = build_state(state_dir)
+    context = CommandContext(manifests=manifests, servers=servers, by_name=by_name, state=state)
+    return context, digest.hexdigest()
+
+
+def make_survey_result(
+    context: CommandContext,
+    now: Optional[datetime] = None,
+    fingerprint: Optional[str] = None,
+) -> SurveyResult:
+    if fingerprint is None:
+        fingerprint = calculate_fingerprint(context.manifests)
     return SurveyResult(
         servers=context.servers,
         fingerprint=fingerprint,
-        generated_at=datetime.now(timezone.utc),
+        generated_at=now if now is not None else datetime.now(timezone.utc),
         source_paths=context.manifests,
     )
 
 
 def find_server(context: CommandContext, name: str) -> ServerConfig:
-    for server in context.servers:
-        if server.name == name:
-            return server
-    raise KeyError(f"Unknown server: {name}")
+    try:
+        return context.by_name[name]
+    except KeyError:
+        raise KeyError(f"Unknown server: {name}") from None
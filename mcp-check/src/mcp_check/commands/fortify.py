@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+from collections import defaultdict
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List, Optional
 
@@ -19,67 +21,63 @@ _DEFENCE_ACTIONS = {
     "stream_overflow": "Apply streamable-http bandwidth cap and chunk throttling.",
 }
 
+_DEFAULT_RUNTIME_ADVICE = "Review and patch detected vulnerability."
+_DEFAULT_POLICY_ADVICE = "Apply stricter runtime policy."
+
+
+@lru_cache(maxsize=128)
+def _sieve_description(rule: str, tool: Optional[str]) -> str:
+    return f"Mitigate rule '{rule}' for tool {tool or 'unknown'}."
+
 
 def _actions_from_pinpoint(findings) -> List[FortifyAction]:
-    actions: List[FortifyAction] = []
-    for finding in findings:
-        if finding.outcome != "vulnerable":
-            continue
-        description = _DEFENCE_ACTIONS.get(finding.scenario, "Review and patch detected vulnerability.")
-        actions.append(
-            FortifyAction(
-                category="runtime",
-                description=description,
-                target=finding.scenario,
-                value=finding.payload,
-            )
+    return [
+        FortifyAction(
+            category="runtime",
+            description=_DEFENCE_ACTIONS.get(finding.scenario, _DEFAULT_RUNTIME_ADVICE),
+            target=finding.scenario,
+            value=finding.payload,
         )
-    return actions
+        for finding in findings
+        if finding.outcome == "vulnerable"
+    ]
 
 
 def _actions_from_sieve(issues) -> List[FortifyAction]:
-    actions: List[FortifyAction] = []
-    for issue in issues:
-        description = f"Mitigate rule '{issue.rule}' for tool {issue.tool or 'unknown'}."
-        actions.append(
-            FortifyAction(
-                category="static",
-                description=description,
-                target=issue.tool or issue.rule,
-                value={"rule": issue.rule, "severity": issue.severity},
-            )
+    return [
+        FortifyAction(
+            category="static",
+            description=_sieve_description(issue.rule, issue.tool),
+            target=issue.tool or issue.rule,
+            value={"rule": issue.rule, "severity": issue.severity},
         )
-    return actions
+        for issue in issues
+    ]
 
 
 def _actions_from_pulse(pulses_for_server) -> List[FortifyAction]:
-    actions: List[FortifyAction] = []
-    for result in pulses_for_server:
-        if result.status != "ok":
-            actions.append(
-                FortifyAction(
-                    category="transport",
-                    description="Configure retries and authentication for unstable handshake.",
-                    target=result.server.name,
-                    value={"status": result.status, "errors": result.errors},
-                )
-            )
-    return actions
+    return [
+        FortifyAction(
+            category="transport",
+            description="Configure retries and authentication for unstable handshake.",
+            target=result.server.name,
+            value={"status": result.status, "errors": result.errors},
+        )
+        for result in pulses_for_server
+        if result.status != "ok"
+    ]
 
 
 def _actions_from_sentinel(alerts) -> List[FortifyAction]:
-    actions: List[FortifyAction] = []
-    for alert in alerts:
-        advice = _DEFENCE_ACTIONS.get(alert.event, "Apply stricter runtime policy.")
-        actions.append(
-            FortifyAction(
-                category="runtime",
-                description=advice,
-                target=alert.event,
-                value=alert.detail,
-            )
+    return [
+        FortifyAction(
+            category="runtime",
+            description=_DEFENCE_ACTIONS.get(alert.event, _DEFAULT_POLICY_ADVICE),
+            target=alert.event,
+            value=alert.detail,
         )
-    return actions
+        for alert in alerts
+    ]
 
 
 def execute(
@@ -89,6 +87,7 @@ def execute(
 ) -> FortifyReport:
     """Generate remediation plans using accumulated command results."""
 
+    generated_at = datetime.now(timezone.utc)
     context = build_context(root, state_dir)
     state = context.state
     pulse_results = pulse.load_all(state)
@@ -96,9 +95,9 @@ def execute(
     sieve_results = sieve.load_all(state)
     sentinel_results = sentinel.load_all(state)
 
-    pulses_by_server: Dict[str, List] = {}
+    pulses_by_server: Dict[str, List] = defaultdict(list)
     for item in pulse_results:
-        pulses_by_server.setdefault(item.server.name, []).append(item)
+        pulses_by_server[item.server.name].append(item)
 
     pinpoint_by_server: Dict[str, List] = {item.server.name: item.findings for item in pinpoint_results}
     sieve_by_server: Dict[str, List] = {item.server.name: item.issues for item in sieve_results}
@@ -106,11 +105,13 @@ def execute(
 
     plans: List[FortifyPlan] = []
     for server in context.servers:
+        name = server.name
         actions: List[FortifyAction] = []
-        actions.extend(_actions_from_pulse(pulses_by_server.get(server.name, [])))
-        actions.extend(_actions_from_pinpoint(pinpoint_by_server.get(server.name, [])))
-        actions.extend(_actions_from_sieve(sieve_by_server.get(server.name, [])))
-        actions.extend(_actions_from_sentinel(sentinel_by_server.get(server.name, [])))
+        extend = actions.extend
+        extend(_actions_from_pulse(pulses_by_server.get(name, ())))
+        extend(_actions_from_pinpoint(pinpoint_by_server.get(name, ())))
+        extend(_actions_from_sieve(sieve_by_server.get(name, ())))
+        extend(_actions_from_sentinel(sentinel_by_server.get(name, ())))
         if server.risks.resource_exhaustion:
             actions.append(
                 FortifyAction(
@@ -122,6 +123,6 @@ def execute(
             )
         plans.append(FortifyPlan(server=server, actions=actions))
 
-    report = FortifyReport(generated_at=datetime.now(timezone.utc), plans=plans)
+    report = FortifyReport(generated_at=generated_at, plans=plans)
     state.write_record("fortify", serialize_fortify(report))
     return report
@@ -15,8 +15,9 @@ def execute(state_dir: Optional[str | Path] = None) -> LedgerReport:
     """Aggregate the latest data from previous commands."""
 
     state = StateStore(state_dir)
+    generated_at = datetime.now(timezone.utc)
     report = LedgerReport(
-        generated_at=datetime.now(timezone.utc),
+        generated_at=generated_at,
         survey=survey.latest(state),
         pulses=pulse.load_all(state),
         pinpoints=pinpoint.load_all(state),
@@ -5,7 +5,7 @@ from __future__ import annotations
 from pathlib import Path
 from typing import Iterable, List, Optional
 
-from ..models import PinpointResult, PinpointScenario
+from ..models import PinpointResult, PinpointScenario, ServerConfig
 from ..state import StateStore, serialize_pinpoint
 from .common import build_context, find_server
 
@@ -25,25 +25,41 @@ _DEFAULT_SCENARIOS = {
 }
 
 
+# Maps each scenario to the RiskVector attributes that make it exploitable
+# and the evidence reported when it is.
+_SCENARIO_DISPATCH = {
+    "prompt_injection": (
+        ("prompt_injection",),
+        {"response": "Embedded hidden instruction echoed user secrets."},
+    ),
+    "tool_poisoning": (
+        ("tool_poisoning", "sensitive_access"),
+        {"tool": "filesystem", "status": "unexpected file access granted"},
+    ),
+    "rce": (
+        ("rce",),
+        {"process": "shell", "note": "Command execution chain detected"},
+    ),
+}
+
+
 def _evaluate(server, scenario: str, payload: dict, severity: str) -> PinpointScenario:
     risks = server.risks
-    outcome = "blocked"
-    evidence = {"detail": "Server rejected payload."}
-    if scenario == "prompt_injection" and risks.prompt_injection:
-        outcome = "vulnerable"
-        evidence = {"response": "Embedded hidden instruction echoed user secrets."}
-    elif scenario == "tool_poisoning" and (risks.tool_poisoning or risks.sensitive_access):
-        outcome = "vulnerable"
-        evidence = {"tool": "filesystem", "status": "unexpected file access granted"}
-    elif scenario == "rce" and risks.rce:
-        outcome = "vulnerable"
-        evidence = {"process": "shell", "note": "Command execution chain detected"}
+    risk_attrs, vulnerable_evidence = _SCENARIO_DISPATCH.get(scenario, ((), None))
+    if vulnerable_evidence is not None and any(getattr(risks, attr) for attr in risk_attrs):
+        return PinpointScenario(
+            scenario=scenario,
+            payload=payload,
+            outcome="vulnerable",
+            evidence=dict(vulnerable_evidence),
+            severity="high",
+        )
     return PinpointScenario(
         scenario=scenario,
         payload=payload,
-        outcome=outcome,
-        evidence=evidence,
-        severity="high" if outcome == "vulnerable" else severity,
+        outcome="blocked",
+        evidence={"detail": "Server rejected payload."},
+        severity=severity,
     )
 
 
@@ -58,7 +74,7 @@ def execute(
 
     context = build_context(root, state_dir)
     server = find_server(context, server_name)
-    selected = list(scenarios) if scenarios is not None else list(_DEFAULT_SCENARIOS.keys())
+    selected = scenarios if scenarios is not None else _DEFAULT_SCENARIOS
     findings: List[PinpointScenario] = []
     for name in selected:
         config = _DEFAULT_SCENARIOS.get(name)
@@ -71,14 +87,13 @@ def execute(
 
 
 def load_all(state: StateStore) -> List[PinpointResult]:
-    from ..models import ServerConfig
-
-    records = list(state.iter_records("pinpoint"))
     results: List[PinpointResult] = []
-    for _, data in records:
-        server_obj = ServerConfig.from_dict(data["server"])
+    from_dict = ServerConfig.from_dict
+    scenario_cls = PinpointScenario
+    for _, data in state.iter_records("pinpoint"):
+        server_obj = from_dict(data["server"])
         findings = [
-            PinpointScenario(
+            scenario_cls(
                 scenario=item.get("scenario", "unknown"),
                 payload=item.get("payload", {}),
                 outcome=item.get("outcome", "unknown"),
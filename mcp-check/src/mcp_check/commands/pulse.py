@@ -5,7 +5,7 @@ from __future__ import annotations
 from pathlib import Path
 from typing import List, Optional
 
-from ..models import PulseResult, Transport
+from ..models import _TRANSPORT_MAP, PulseResult, ServerConfig, Transport
 from ..state import StateStore, serialize_pulse
 from .common import build_context, find_server
 
@@ -41,18 +41,18 @@ def execute(
 def load_all(state: StateStore) -> List[PulseResult]:
     """Load all pulse entries from *state*."""
 
-    records = list(state.iter_records("pulse"))
     results: List[PulseResult] = []
-    from ..models import ServerConfig
-
-    for _, data in records:
-        server_obj = ServerConfig.from_dict(data["server"])
+    from_dict = ServerConfig.from_dict
+    transport_map = _TRANSPORT_MAP
+    for _, data in state.iter_records("pulse"):
+        server_obj = from_dict(data["server"])
         transport_value = data.get("transport_used", server_obj.transport.value)
+        transport = transport_map.get(transport_value) or Transport(transport_value)
         results.append(
             PulseResult(
                 server=server_obj,
                 latency_ms=int(data.get("latency_ms", 0)),
-                transport_used=Transport(transport_value),
+                transport_used=transport,
                 status=data.get("status", "unknown"),
                 errors=list(data.get("errors", [])),
             )
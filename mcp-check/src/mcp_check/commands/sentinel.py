@@ -3,28 +3,56 @@
 from __future__ import annotations
 
 from pathlib import Path
-from typing import List, Optional
+from typing import Any, Dict, Iterator, List, Optional
 
-from ..models import RuntimeEvent, SentinelResult
+from ..models import RuntimeEvent, SentinelResult, ServerConfig
 from ..state import StateStore, serialize_sentinel
 from .common import build_context, find_server
 
 
+def _check_tool_call(event: RuntimeEvent, stream_threshold: int, rate_limit: int) -> Optional[RuntimeEvent]:
+    if not event.detail.get("approved", True):
+        return RuntimeEvent(event="tool_call_blocked", detail=event.detail, severity="high")
+    return None
+
+
+def _check_command_exec(event: RuntimeEvent, stream_threshold: int, rate_limit: int) -> Optional[RuntimeEvent]:
+    if event.detail.get("command"):
+        return RuntimeEvent(event="command_exec", detail=event.detail, severity="critical")
+    return None
+
+
+def _check_stream_chunk(event: RuntimeEvent, stream_threshold: int, rate_limit: int) -> Optional[RuntimeEvent]:
+    size = int(event.detail.get("bytes", 0))
+    if size > stream_threshold:
+        return RuntimeEvent(event="stream_overflow", detail={"bytes": size}, severity="high")
+    return None
+
+
+def _check_request_rate(event: RuntimeEvent, stream_threshold: int, rate_limit: int) -> Optional[RuntimeEvent]:
+    count = int(event.detail.get("count", 0))
+    if count > rate_limit:
+        return RuntimeEvent(event="rate_limit", detail={"count": count}, severity="medium")
+    return None
+
+
+_ALERT_CHECKS = {
+    "tool_call": _check_tool_call,
+    "command_exec": _check_command_exec,
+    "stream_chunk": _check_stream_chunk,
+    "request_rate": _check_request_rate,
+}
+
+
 def _detect_alerts(events: List[RuntimeEvent], stream_threshold: int, rate_limit: int) -> List[RuntimeEvent]:
     alerts: List[RuntimeEvent] = []
+    checks = _ALERT_CHECKS
     for event in events:
-        if event.event == "tool_call" and not event.detail.get("approved", True):
-            alerts.append(RuntimeEvent(event="tool_call_blocked", detail=event.detail, severity="high"))
-        if event.event == "command_exec" and event.detail.get("command"):
-            alerts.append(RuntimeEvent(event="command_exec", detail=event.detail, severity="critical"))
-        if event.event == "stream_chunk":
-            size = int(event.detail.get("bytes", 0))
-            if size > stream_threshold:
-                alerts.append(RuntimeEvent(event="stream_overflow", detail={"bytes": size}, severity="high"))
-        if event.event == "request_rate":
-            count = int(event.detail.get("count", 0))
-            if count > rate_limit:
-                alerts.append(RuntimeEvent(event="rate_limit", detail={"count": count}, severity="medium"))
+        check = checks.get(event.event)
+        if check is not None:
+            alert = check(event, stream_threshold, rate_limit)
+            if alert is not None:
+                alerts.append(alert)
     return alerts
 
 
@@ -47,28 +75,33 @@ def execute(
     return result
 
 
-def load_all(state: StateStore) -> List[SentinelResult]:
-    from ..models import ServerConfig
-
-    records = list(state.iter_records("sentinel"))
-    results: List[SentinelResult] = []
-    for _, data in records:
-        server_obj = ServerConfig.from_dict(data["server"])
-        events = [
-            RuntimeEvent(
-                event=item.get("event", "unknown"),
-                detail=item.get("detail", {}),
-                severity=item.get("severity", "info"),
-            )
-            for item in data.get("events", [])
-        ]
-        alerts = [
-            RuntimeEvent(
-                event=item.get("event", "unknown"),
-                detail=item.get("detail", {}),
-                severity=item.get("severity", "info"),
-            )
-            for item in data.get("alerts", [])
-        ]
-        results.append(SentinelResult(server=server_obj, events=events, alerts=alerts))
-    return results
+def _result_from_record(data: Dict[str, Any]) -> SentinelResult:
+    event_from_dict = RuntimeEvent.from_dict
+    return SentinelResult(
+        server=ServerConfig.from_dict(data["server"]),
+        events=[event_from_dict(item) for item in data.get("events", [])],
+        alerts=[event_from_dict(item) for item in data.get("alerts", [])],
+    )
+
+
+def iter_results(state: StateStore, limit: Optional[int] = None) -> Iterator[SentinelResult]:
+    """Yield stored sentinel results one record at a time, newest-last.
+
+    *limit* bounds the scan to the most recent records.
+    """
+
+    for _, data in state.iter_records("sentinel", limit=limit):
+        yield _result_from_record(data)
+
+
+def latest(state: StateStore) -> Optional[SentinelResult]:
+    """Return the most recent sentinel entry from *state*."""
+
+    record = state.latest_record("sentinel")
+    if record is None:
+        return None
+    return _result_from_record(record[1])
+
+
+def load_all(state: StateStore, limit: Optional[int] = None) -> List[SentinelResult]:
+    return list(iter_results(state, limit=limit))
@@ -2,21 +2,40 @@
 
 from __future__ import annotations
 
+import json
 import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Optional
+from typing import Any, Dict, Iterator, List, Optional
 
-from ..models import SieveIssue, SieveResult
+from ..models import ServerConfig, SieveIssue, SieveResult
 from ..state import StateStore, serialize_sieve
 from .common import build_context, find_server
 
+try:  # Optional speedup: multi-pattern DFA scanning in C.
+    import hyperscan
+except ImportError:  # pragma: no cover - depends on environment
+    hyperscan = None  # type: ignore[assignment]
+
+try:  # Optional speedup: C-level schema serialization.
+    import orjson
+except ImportError:  # pragma: no cover - depends on environment
+    orjson = None  # type: ignore[assignment]
+
 _PATTERNS = {
-    "hidden_instruction": re.compile(r"ignore\s+all\s+previous\s+instructions", re.IGNORECASE),
-    "exfiltration": re.compile(r"(upload|exfiltrate|send)\s+(file|data)", re.IGNORECASE),
-    "sensitive_access": re.compile(r"/(etc|var|home)/", re.IGNORECASE),
-    "cross_origin": re.compile(r"https?://[^\s]+", re.IGNORECASE),
+    "hidden_instruction": r"ignore\s+all\s+previous\s+instructions",
+    "exfiltration": r"(?:upload|exfiltrate|send)\s+(?:file|data)",
+    "sensitive_access": r"/(?:etc|var|home)/",
+    "cross_origin": r"https?://[^\s]+",
 }
 
+# Each rule is compiled once and searched independently: an alternation
+# would return non-overlapping matches, so one rule's match could consume
+# the only text span another rule would hit (e.g. a URL containing /etc/),
+# and the hyperscan backend already reports every pattern on its own.
+_COMPILED = {key: re.compile(pattern, re.IGNORECASE) for key, pattern in _PATTERNS.items()}
+
 _SEVERITY = {
     "hidden_instruction": "high",
     "exfiltration": "high",
@@ -24,21 +43,83 @@ _SEVERITY = {
     "cross_origin": "medium",
 }
 
+_RULE_IDS = tuple(_PATTERNS)
 
-def _inspect_tool(tool) -> List[SieveIssue]:
-    issues: List[SieveIssue] = []
-    text = f"{tool.description} {tool.input_schema}".lower()
-    for key, pattern in _PATTERNS.items():
+# Cheap literal prefilter: every rule match contains at least one of these
+# substrings, so text without any of them can skip the regex engine entirely.
+_TRIGGERS = ("ignore", "upload", "exfiltrate", "send", "/etc", "/var", "/home", "http")
+
+if hyperscan is not None:
+    _HS_DB = hyperscan.Database()
+    _HS_DB.compile(
+        expressions=[pattern.encode() for pattern in _PATTERNS.values()],
+        ids=list(range(len(_PATTERNS))),
+        flags=[hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_SINGLEMATCH] * len(_PATTERNS),
+    )
+else:
+    _HS_DB = None
+
+# Hyperscan scratch spaces must not be shared between concurrent scans,
+# so each worker thread gets its own.
+_HS_LOCAL = threading.local()
+
+
+def _hs_scratch():
+    scratch = getattr(_HS_LOCAL, "scratch", None)
+    if scratch is None:
+        scratch = hyperscan.Scratch(_HS_DB)
+        _HS_LOCAL.scratch = scratch
+    return scratch
+
+
+def _matched_rules(text: str) -> set[str]:
+    """Return the names of every rule that matches *text*."""
+
+    matched: set[str] = set()
+    lowered = text.lower()
+    if not any(trigger in lowered for trigger in _TRIGGERS):
+        return matched
+    if _HS_DB is not None:
+        _HS_DB.scan(
+            text.encode("utf-8", errors="replace"),
+            match_event_handler=lambda rule_id, start, end, flags, ctx: matched.add(_RULE_IDS[rule_id]),
+            scratch=_hs_scratch(),
+        )
+        return matched
+    for rule, pattern in _COMPILED.items():
         if pattern.search(text):
-            issues.append(
-                SieveIssue(
-                    rule=key,
-                    description=f"Pattern '{key}' detected in tool description",
-                    severity=_SEVERITY.get(key, "low"),
-                    tool=tool.name,
-                )
-            )
-    return issues
+            matched.add(rule)
+    return matched
+
+
+def _schema_text(schema) -> str:
+    if not schema:
+        return ""
+    if orjson is not None:
+        return orjson.dumps(schema, default=str).decode()
+    # default=str keeps non-JSON-native values (e.g. TOML datetimes from
+    # tomllib) scannable instead of raising TypeError.
+    return json.dumps(schema, default=str)
+
+
+def _inspect_tool(tool) -> List[SieveIssue]:
+    matched = _matched_rules(tool.description) if tool.description else set()
+    if len(matched) < len(_RULE_IDS):
+        schema_text = _schema_text(tool.input_schema)
+        if schema_text:
+            matched |= _matched_rules(schema_text)
+    if not matched:
+        return []
+    return [
+        SieveIssue(
+            rule=rule,
+            description=f"Pattern '{rule}' detected in tool description",
+            severity=_SEVERITY.get(rule, "low"),
+            tool=tool.name,
+        )
+        for rule in _RULE_IDS
+        if rule in matched
+    ]
 
 
 def execute(
@@ -46,35 +127,56 @@ def execute(
     server_name: str,
     *,
     state_dir: Optional[str | Path] = None,
+    workers: Optional[int] = None,
 ) -> SieveResult:
-    """Run static analysis heuristics against the server tools."""
+    """Run static analysis heuristics against the server tools.
+
+    When *workers* is greater than one, tools are scanned on a thread
+    pool; this pays off when a GIL-releasing engine such as hyperscan is
+    installed, and single-server calls skip the pool by default.
+    """
 
     context = build_context(root, state_dir)
     server = find_server(context, server_name)
-    issues: List[SieveIssue] = []
-    for tool in server.tools:
-        issues.extend(_inspect_tool(tool))
+    if workers is not None and workers > 1 and len(server.tools) > 1:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            issue_batches = list(executor.map(_inspect_tool, server.tools))
+    else:
+        issue_batches = [_inspect_tool(tool) for tool in server.tools]
+    issues: List[SieveIssue] = [issue for batch in issue_batches for issue in batch]
     score = max(0, 100 - 15 * len(issues))
     result = SieveResult(server=server, issues=issues, score=score)
     context.state.write_record("sieve", serialize_sieve(result))
     return result
 
 
-def load_all(state: StateStore) -> List[SieveResult]:
-    from ..models import ServerConfig
-
-    records = list(state.iter_records("sieve"))
-    results: List[SieveResult] = []
-    for _, data in records:
-        server_obj = ServerConfig.from_dict(data["server"])
-        issues = [
-            SieveIssue(
-                rule=item.get("rule", "unknown"),
-                description=item.get("description", ""),
-                severity=item.get("severity", "low"),
-                tool=item.get("tool"),
-            )
-            for item in data.get("issues", [])
-        ]
-        results.append(SieveResult(server=server_obj, issues=issues, score=int(data.get("score", 0))))
-    return results
+def _result_from_record(data: Dict[str, Any]) -> SieveResult:
+    issue_from_dict = SieveIssue.from_dict
+    return SieveResult(
+        server=ServerConfig.from_dict(data["server"]),
+        issues=[issue_from_dict(item) for item in data.get("issues", [])],
+        score=int(data.get("score", 0)),
+    )
+
+
+def iter_results(state: StateStore, limit: Optional[int] = None) -> Iterator[SieveResult]:
+    """Yield stored sieve results one record at a time, newest-last.
+
+    *limit* bounds the scan to the most recent records.
+    """
+
+    for _, data in state.iter_records("sieve", limit=limit):
+        yield _result_from_record(data)
+
+
+def latest(state: StateStore) -> Optional[SieveResult]:
+    """Return the most recent sieve entry from *state*."""
+
+    record = state.latest_record("sieve")
+    if record is None:
+        return None
+    return _result_from_record(record[1])
+
+
+def load_all(state: StateStore, limit: Optional[int] = None) -> List[SieveResult]:
+    return list(iter_results(state, limit=limit))
@@ -2,19 +2,20 @@
 
 from __future__ import annotations
 
+from datetime import datetime
 from pathlib import Path
 from typing import Optional
 
-from ..models import SurveyResult
+from ..models import ServerConfig, SurveyResult
 from ..state import StateStore, serialize_survey
-from .common import build_context, make_survey_result
+from .common import build_survey_context, make_survey_result
 
 
 def execute(root: str | Path, state_dir: Optional[str | Path] = None) -> SurveyResult:
     """Load manifests under *root* and persist a survey snapshot."""
 
-    context = build_context(root, state_dir)
-    survey = make_survey_result(context)
+    context, fingerprint = build_survey_context(root, state_dir)
+    survey = make_survey_result(context, fingerprint=fingerprint)
     payload = serialize_survey(survey)
     context.state.write_record("survey", payload)
     return survey
@@ -23,9 +24,6 @@ def execute(root: str | Path, state_dir: Optional[str | Path] = None) -> SurveyR
 def latest(state: StateStore) -> Optional[SurveyResult]:
     """Return the most recent survey entry from *state*."""
 
-    from datetime import datetime
-    from ..models import ServerConfig
-
     record = state.latest_record("survey")
     if record is None:
         return None
@@ -3,14 +3,26 @@
 from __future__ import annotations
 
 import json
+import os
 import tomllib
 from hashlib import sha256
 from pathlib import Path
-from typing import Iterable, List, Sequence
+from typing import Dict, Iterable, List, Sequence, Tuple
+
+try:  # Optional speedup: C-level JSON parsing for manifests.
+    import orjson
+except ImportError:  # pragma: no cover - depends on environment
+    orjson = None  # type: ignore[assignment]
 
 from .models import ServerConfig
 
-SUPPORTED_SUFFIXES = {".json", ".toml"}
+SUPPORTED_SUFFIXES = (".json", ".toml")
+
+_json_loads = json.loads if orjson is None else orjson.loads
+
+# Multiple of the 64-byte SHA-256 block size, large enough to keep the
+# hashing loop inside OpenSSL per update call.
+_FINGERPRINT_CHUNK_SIZE = 256 * 1024
 
 
 def discover_manifests(root: Path | str) -> List[Path]:
@@ -19,19 +31,57 @@ def discover_manifests(root: Path | str) -> List[Path]:
     root_path = Path(root)
     if not root_path.exists():
         return []
-    candidates: List[Path] = []
-    for suffix in SUPPORTED_SUFFIXES:
-        candidates.extend(root_path.rglob(f"*{suffix}"))
-    return sorted({path for path in candidates if path.is_file()})
+    found: List[str] = []
+    stack = [str(root_path)]
+    while stack:
+        try:
+            entries = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.name.endswith(SUPPORTED_SUFFIXES) and entry.is_file():
+                    found.append(entry.path)
+    found.sort()
+    return [Path(path) for path in found]
+
+
+# Parsed manifests keyed by path, invalidated by mtime, so repeated
+# build_context calls within one process parse each file once.
+_MANIFEST_CACHE: Dict[str, Tuple[int, List[ServerConfig]]] = {}
+
+
+def load_manifest(path: Path, raw: bytes | None = None) -> List[ServerConfig]:
+    """Load a manifest file into :class:`ServerConfig` objects.
+
+    Callers that already hold the file contents can pass them as *raw* to
+    avoid a second read when the cache is stale.
+    """
 
+    key = str(path)
+    try:
+        mtime_ns = path.stat().st_mtime_ns
+    except OSError:
+        mtime_ns = None
+    if mtime_ns is not None:
+        cached = _MANIFEST_CACHE.get(key)
+        if cached is not None and cached[0] == mtime_ns:
+            return list(cached[1])
+    servers = _parse_manifest(path, raw)
+    if mtime_ns is not None:
+        _MANIFEST_CACHE[key] = (mtime_ns, servers)
+    return list(servers)
 
-def load_manifest(path: Path) -> List[ServerConfig]:
-    """Load a manifest file into :class:`ServerConfig` objects."""
 
+def _parse_manifest(path: Path, raw: bytes | None = None) -> List[ServerConfig]:
+    if raw is None:
+        raw = path.read_bytes()
     if path.suffix.lower() == ".json":
-        data = json.loads(path.read_text(encoding="utf-8"))
+        data = _json_loads(raw)
     elif path.suffix.lower() == ".toml":
-        data = tomllib.loads(path.read_text(encoding="utf-8"))
+        data = tomllib.loads(raw.decode("utf-8"))
     else:
         raise ValueError(f"Unsupported manifest format: {path}")
 
@@ -55,7 +105,8 @@ def calculate_fingerprint(paths: Iterable[Path]) -> str:
 
     digest = sha256()
     for path in sorted(paths):
-        digest.update(str(path).encode("utf-8"))
-        digest.update(b"\0")
-        digest.update(path.read_bytes())
+        digest.update(str(path).encode("utf-8") + b"\0")
+        with path.open("rb") as handle:
+            while chunk := handle.read(_FINGERPRINT_CHUNK_SIZE):
+                digest.update(chunk)
     return digest.hexdigest()
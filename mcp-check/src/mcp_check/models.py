@@ -18,6 +18,16 @@ class Transport(str, Enum):
     STREAMABLE_HTTP = "streamable-http"
 
 
+# Value-to-member map so bulk loads skip Enum.__call__ for the common case.
+_TRANSPORT_MAP = {transport.value: transport for transport in Transport}
+
+# Manifest keys consumed by ServerConfig.from_dict; everything else lands in
+# ServerConfig.metadata.
+_NON_METADATA_KEYS = frozenset(
+    {"name", "transport", "endpoint", "tools", "scenarios", "runtime_profile", "risks"}
+)
+
+
 @dataclass(slots=True)
 class ToolDefinition:
     """Simplified representation of an MCP tool."""
@@ -45,6 +55,14 @@ class RuntimeEvent:
     detail: Dict[str, Any] = field(default_factory=dict)
     severity: str = "info"
 
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "RuntimeEvent":
+        return cls(
+            event=data.get("event", "unknown"),
+            detail=data.get("detail", {}),
+            severity=data.get("severity", "info"),
+        )
+
 
 @dataclass(slots=True)
 class RiskVector:
@@ -73,14 +91,16 @@ class ServerConfig:
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "ServerConfig":
-        transport = Transport(data.get("transport", "stdio"))
+        get = data.get
+        transport_value = get("transport", "stdio")
+        transport = _TRANSPORT_MAP.get(transport_value) or Transport(transport_value)
         tools = [
             ToolDefinition(
                 name=item["name"],
                 description=item.get("description", ""),
                 input_schema=item.get("input_schema", {}),
             )
-            for item in data.get("tools", [])
+            for item in get("tools", ())
         ]
         scenarios = {
             key: ServerScenario(
@@ -89,7 +109,7 @@ class ServerConfig:
                 capabilities=value.get("capabilities", {}),
                 instructions=value.get("instructions"),
             )
-            for key, value in data.get("scenarios", {}).items()
+            for key, value in get("scenarios", {}).items()
         }
         runtime_profile = [
             RuntimeEvent(
@@ -97,9 +117,9 @@ class ServerConfig:
                 detail=dict(item.get("detail", {})),
                 severity=item.get("severity", "info"),
             )
-            for item in data.get("runtime_profile", [])
+            for item in get("runtime_profile", ())
         ]
-        risk_data = data.get("risks", {})
+        risk_data = get("risks", {})
         risks = RiskVector(
             prompt_injection=bool(risk_data.get("prompt_injection", False)),
             tool_poisoning=bool(risk_data.get("tool_poisoning", False)),
@@ -108,23 +128,18 @@ class ServerConfig:
             rce=bool(risk_data.get("rce", False)),
             resource_exhaustion=bool(risk_data.get("resource_exhaustion", False)),
         )
+        metadata = dict(data)
+        for key in _NON_METADATA_KEYS:
+            metadata.pop(key, None)
         return cls(
             name=data["name"],
             transport=transport,
-            endpoint=data.get("endpoint", ""),
+            endpoint=get("endpoint", ""),
             tools=tools,
             scenarios=scenarios,
             runtime_profile=runtime_profile,
             risks=risks,
-            metadata={key: value for key, value in data.items() if key not in {
-                "name",
-                "transport",
-                "endpoint",
-                "tools",
-                "scenarios",
-                "runtime_profile",
-                "risks",
-            }},
+            metadata=metadata,
         )
 
 
@@ -173,6 +188,15 @@ class SieveIssue:
     severity: str
     tool: Optional[str] = None
 
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "SieveIssue":
+        return cls(
+            rule=data.get("rule", "unknown"),
+            description=data.get("description", ""),
+            severity=data.get("severity", "low"),
+            tool=data.get("tool"),
+        )
+
 
 @dataclass(slots=True)
 class SieveResult:
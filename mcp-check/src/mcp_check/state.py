@@ -3,11 +3,17 @@
 from __future__ import annotations
 
 import json
+import os
 from dataclasses import asdict, is_dataclass
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, Iterable, Iterator, Optional, Tuple
 
+try:  # Optional speedup: C-level JSON encode/decode for state files.
+    import orjson
+except ImportError:  # pragma: no cover - depends on environment
+    orjson = None  # type: ignore[assignment]
+
 from .models import (
     FortifyPlan,
     FortifyReport,
@@ -44,6 +50,9 @@ def _default(obj: Any) -> Any:
     return obj
 
 
+_loads = json.loads if orjson is None else orjson.loads
+
+
 class StateStore:
     """Simple JSON file based storage for command outputs."""
 
@@ -66,7 +75,12 @@ class StateStore:
         command_dir = self._command_dir(namespace)
         timestamp = self._timestamp()
         file_path = command_dir / f"{timestamp}.json"
-        file_path.write_text(json.dumps(payload, indent=2, sort_keys=True), encoding="utf-8")
+        if orjson is not None:
+            file_path.write_bytes(
+                orjson.dumps(payload, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS, default=_default)
+            )
+        else:
+            file_path.write_text(json.dumps(payload, indent=2, sort_keys=True), encoding="utf-8")
         return file_path
 
     def write_dataclass(self, namespace: str, obj: Any) -> Path:
@@ -79,16 +93,29 @@ class StateStore:
 
     def latest_record(self, namespace: str) -> Optional[Tuple[Path, Dict[str, Any]]]:
         command_dir = self._command_dir(namespace)
-        files = sorted(command_dir.glob("*.json"))
-        if not files:
+        best: Optional[str] = None
+        with os.scandir(command_dir) as entries:
+            for entry in entries:
+                # Timestamped names are zero padded, so lexicographic max is
+                # chronological max.
+                if entry.name.endswith(".json") and (best is None or entry.name > best):
+                    best = entry.name
+        if best is None:
             return None
-        latest = files[-1]
-        return latest, json.loads(latest.read_text(encoding="utf-8"))
+        latest = command_dir / best
+        return latest, _loads(latest.read_bytes())
+
+    def iter_records(
+        self, namespace: str, limit: Optional[int] = None
+    ) -> Iterator[Tuple[Path, Dict[str, Any]]]:
+        """Yield stored records oldest first, optionally only the last *limit*."""
 
-    def iter_records(self, namespace: str) -> Iterator[Tuple[Path, Dict[str, Any]]]:
         command_dir = self._command_dir(namespace)
-        for path in sorted(command_dir.glob("*.json")):
-            yield path, json.loads(path.read_text(encoding="utf-8"))
+        paths = sorted(command_dir.glob("*.json"))
+        if limit is not None:
+            paths = paths[-limit:] if limit > 0 else []
+        for path in paths:
+            yield path, _loads(path.read_bytes())
 
 
 def serialize_survey(result: SurveyResult) -> Dict[str, Any]:
@@ -0,0 +1,9 @@
+"""Names of the fixture servers, shared across test modules."""
+
+from enum import StrEnum
+
+
+class Server(StrEnum):
+    ATLAS = "atlas"
+    ECHO = "echo"
+    FLUX = "flux"
@@ -1,9 +1,9 @@
-from __future__ import annotations
-
 from pathlib import Path
 
 import pytest
 
+from mcp_check.state import StateStore
+
 
 @pytest.fixture(scope="session")
 def fixtures_dir() -> Path:
@@ -16,5 +16,17 @@ def state_dir(tmp_path: Path) -> Path:
 
 
 @pytest.fixture()
+def store(state_dir: Path) -> StateStore:
+    return StateStore(state_dir)
+
+
+@pytest.fixture(scope="module")
+def module_state_dir(tmp_path_factory) -> Path:
+    """State directory for module-scoped fixtures, which cannot use tmp_path."""
+
+    return tmp_path_factory.mktemp("state")
+
+
+@pytest.fixture(scope="session")
 def root_path(fixtures_dir: Path) -> Path:
     return fixtures_dir
@@ -0,0 +1,39 @@
+import pytest
+
+from mcp_check.commands import pinpoint, pulse, sentinel, sieve
+from mcp_check.state import StateStore
+
+from _servers import Server
+
+
+@pytest.fixture(scope="module")
+def roundtrip_state(module_state_dir, fixtures_dir):
+    """One state directory shared by the per-command round-trip checks."""
+
+    pulse.execute(fixtures_dir, Server.ATLAS, state_dir=module_state_dir)
+    pinpoint.execute(fixtures_dir, Server.ECHO, state_dir=module_state_dir)
+    sieve.execute(fixtures_dir, Server.ECHO, state_dir=module_state_dir)
+    sentinel.execute(fixtures_dir, Server.FLUX, state_dir=module_state_dir)
+    return module_state_dir
+
+
+@pytest.fixture(scope="module")
+def roundtrip_store(roundtrip_state) -> StateStore:
+    """One StateStore shared by every round-trip case instead of one each."""
+
+    return StateStore(roundtrip_state)
+
+
+@pytest.mark.parametrize(
+    ("command", "server"),
+    [
+        (pulse, Server.ATLAS),
+        (pinpoint, Server.ECHO),
+        (sieve, Server.ECHO),
+        (sentinel, Server.FLUX),
+    ],
+    ids=["pulse", "pinpoint", "sieve", "sentinel"],
+)
+def test_command_results_round_trip(command, server, roundtrip_store):
+    by_server = {item.server.name: item for item in command.load_all(roundtrip_store)}
+    assert server in by_server